@@ -1,36 +1,153 @@
 __version__ = "2.0.10"
 
-# flake8: noqa: F401
-from .asset import *
-from .audit import *
-from .automod import *
-from .backend import *
-from .channel import *
-from .client import *
-from .colour import *
-from .context import *
-from .cooldowns import *
-from .embeds import *
-from .emoji import *
-from .entitlements import *
-from .enums import *
-from .errors import *
-from .file import *
-from .flags import *
-from .guild import *
-from .http import *
-from .invite import *
-from .member import *
-from .mentions import *
-from .message import *
-from .multipart import *
-from .object import *
-from .response import *
-from .role import *
-from .soundboard import *
-from .sticker import *
-from .user import *
+# flake8: noqa: F401, F403
+import importlib as _importlib
+
+from typing import Any as _Any, TYPE_CHECKING as _TYPE_CHECKING
+
 from .utils import MISSING, DISCORD_EPOCH, _MissingType
-from .view import *
-from .voice import *
-from .webhook import *
+
+if _TYPE_CHECKING:
+    from .asset import *
+    from .audit import *
+    from .automod import *
+    from .backend import *
+    from .channel import *
+    from .client import *
+    from .colour import *
+    from .context import *
+    from .cooldowns import *
+    from .embeds import *
+    from .emoji import *
+    from .entitlements import *
+    from .enums import *
+    from .errors import *
+    from .file import *
+    from .flags import *
+    from .guild import *
+    from .http import *
+    from .invite import *
+    from .member import *
+    from .mentions import *
+    from .message import *
+    from .multipart import *
+    from .object import *
+    from .response import *
+    from .role import *
+    from .soundboard import *
+    from .sticker import *
+    from .user import *
+    from .view import *
+    from .voice import *
+    from .webhook import *
+
+# Submodules are only imported once one of their public names is accessed,
+# keeping `import discord_http` cheap for users that only need a few of them.
+_lazy_modules: dict[str, tuple[str, ...]] = {
+    "asset": ("Asset",),
+    "audit": ("AuditLogEntry", "AuditChange"),
+    "automod": ("AutoModRuleTriggers", "AutoModRuleAction", "PartialAutoModRule", "AutoModRule"),
+    "backend": ("DiscordHTTP",),
+    "channel": (
+        "BaseChannel", "CategoryChannel", "DMChannel", "DirectoryChannel",
+        "ForumChannel", "ForumTag", "ForumThread", "GroupDMChannel", "NewsChannel",
+        "NewsThread", "PartialChannel", "PartialThread", "PrivateThread", "PublicThread",
+        "StageChannel", "StoreChannel", "TextChannel", "Thread", "VoiceChannel",
+        "VoiceRegion",
+    ),
+    "client": ("Client",),
+    "colour": ("Color", "Colour"),
+    "context": ("Context", "InteractionResponse"),
+    "cooldowns": ("BucketType", "CooldownCache", "Cooldown"),
+    "embeds": ("Embed",),
+    "emoji": ("Emoji", "EmojiParser", "PartialEmoji"),
+    "entitlements": ("Entitlements", "PartialEntitlements", "PartialSKU", "SKU"),
+    "enums": (
+        "ApplicationCommandType", "AuditLogType", "AutoModRuleActionType",
+        "AutoModRuleEventType", "AutoModRulePresetType", "AutoModRuleTriggerType",
+        "BaseEnum", "ButtonStyles", "ChannelType", "CommandOptionType", "ComponentType",
+        "ContentFilterLevel", "DefaultAvatarType", "DefaultNotificationLevel",
+        "EntitlementOwnerType", "EntitlementType", "ExpireBehaviour", "ForumLayoutType",
+        "IntegrationType", "InteractionType", "InviteType", "MFALevel",
+        "MessageReferenceType", "MessageType", "PermissionType", "PrivacyLevelType",
+        "ReactionType", "ResponseType", "SKUType", "ScheduledEventEntityType",
+        "ScheduledEventStatusType", "SortOrderType", "StickerFormatType", "StickerType",
+        "TextStyles", "VerificationLevel", "VideoQualityType", "WebhookType",
+    ),
+    "errors": (
+        "AutomodBlock", "BotMissingPermissions", "CheckFailed", "CommandError",
+        "CommandOnCooldown", "DiscordException", "DiscordServerError", "Forbidden",
+        "HTTPException", "InvalidMember", "NotFound", "Ratelimited",
+        "UserMissingPermissions",
+    ),
+    "file": ("File",),
+    "flags": (
+        "ApplicationFlags", "AttachmentFlags", "BaseFlag", "ChannelFlags",
+        "GuildMemberFlags", "MessageFlags", "PermissionOverwrite", "Permissions",
+        "UserFlags", "SKUFlags", "SystemChannelFlags",
+    ),
+    "guild": ("Guild", "PartialGuild", "PartialScheduledEvent", "ScheduledEvent", "BanEntry"),
+    "http": ("DiscordAPI", "HTTPResponse"),
+    "invite": ("Invite", "PartialInvite"),
+    "member": ("PartialMember", "Member", "ThreadMember"),
+    "mentions": ("AllowedMentions",),
+    "message": (
+        "Attachment", "JumpURL", "Message", "MessageInteraction", "MessageReference",
+        "PartialMessage", "Poll", "WebhookMessage",
+    ),
+    "multipart": ("MultipartData",),
+    "object": ("PartialBase", "Snowflake"),
+    "response": ("AutocompleteResponse", "DeferResponse", "MessageResponse", "Ping"),
+    "role": ("PartialRole", "Role"),
+    "soundboard": ("PartialSoundboardSound", "SoundboardSound"),
+    "sticker": ("PartialSticker", "Sticker"),
+    "user": ("UserClient", "PartialUser", "User"),
+    "view": (
+        "Button", "ChannelSelect", "Item", "Link", "MentionableSelect", "Modal",
+        "ModalItem", "Premium", "RoleSelect", "Select", "UserSelect", "View",
+    ),
+    "voice": ("PartialVoiceState", "VoiceState"),
+    "webhook": ("PartialWebhook", "Webhook"),
+}
+
+_lazy_names: dict[str, str] = {
+    name: module
+    for module, names in _lazy_modules.items()
+    for name in names
+}
+
+# `from discord_http import *` has always exposed the submodules as well
+_submodules: tuple[str, ...] = (
+    *_lazy_modules,
+    "commands", "gateway", "integrations", "utils",
+)
+
+# Type checkers get the names from the star imports above instead
+__all__ = (  # pyright: ignore[reportUnsupportedDunderAll]
+    "MISSING",
+    "DISCORD_EPOCH",
+    *_lazy_names,
+    *_submodules,
+)
+
+
+def __getattr__(name: str) -> _Any:
+    module = _lazy_names.get(name, None)
+    if module is None:
+        try:
+            # Allows `discord_http.<submodule>` to work without an explicit import
+            return _importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    value = getattr(_importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_lazy_names})
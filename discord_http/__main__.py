@@ -1,12 +1,22 @@
-import argparse
-import discord_http
-import platform
 import sys
 
-from importlib.metadata import version
+from functools import cache
 
+_USAGE = "usage: discord.http [-h] [-v]"
 
+_HELP = f"""{_USAGE}
+
+Command-line tool to debug
+
+options:
+  -h, --help     show this help message and exit
+  -v, --version  Show relevant version information"""
+
+
+@cache
 def get_package_version(name: str) -> str:
+    from importlib.metadata import version
+
     try:
         output = version(name)
         if not output.lower().startswith("v"):
@@ -17,6 +27,9 @@ def get_package_version(name: str) -> str:
 
 
 def show_version() -> None:
+    import discord_http
+    import platform
+
     pyver = sys.version_info
 
     container = [
@@ -30,24 +43,23 @@ def show_version() -> None:
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(
-        prog="discord.http",
-        description="Command-line tool to debug"
-    )
-
-    parser.add_argument(
-        "-v",
-        "--version",
-        action="store_true",
-        help="Show relevant version information"
-    )
+    # Only two flags exist, so argparse is not worth importing
+    args = sys.argv[1:]
 
-    args = parser.parse_args()
+    for arg in args:
+        if arg not in ("-h", "--help", "-v", "--version"):
+            print(
+                f"{_USAGE}\ndiscord.http: error: unrecognized arguments: {arg}",
+                file=sys.stderr
+            )
+            sys.exit(2)
 
-    if args.version:
+    if "-h" in args or "--help" in args:
+        print(_HELP)
+    elif "-v" in args or "--version" in args:
         show_version()
     else:
-        parser.print_help()
+        print(_HELP)
 
 
 if __name__ == "__main__":
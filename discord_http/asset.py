@@ -1,7 +1,8 @@
-import yarl
+import asyncio
 import os
 
-from typing import Self, TYPE_CHECKING, Literal
+from typing import Self, TYPE_CHECKING, Literal, Iterable
+from urllib.parse import urlsplit, urlunsplit, urlencode
 
 from . import utils
 from .errors import HTTPException
@@ -14,12 +15,38 @@ AssetFormatTypes = Literal["webp", "jpeg", "jpg", "png", "gif"]
 
 MISSING = utils.MISSING
 
+_ANIMATED_PREFIX = "a_"
+_DECORATION_ANIMATED_PREFIXES = ("v2_a_", _ANIMATED_PREFIX)
+_ANIMATED_FORMAT = "gif"
+_STATIC_FORMAT = "png"
+
+# URL templates used by the Asset._from_* factories,
+# formatted with % to avoid building intermediate f-string parts
+_AVATAR_URL = "%s/avatars/%s/%s.%s?size=1024"
+_DEFAULT_AVATAR_URL = "%s/embed/avatars/%s.png"
+_GUILD_AVATAR_URL = "%s/guilds/%s/users/%s/avatars/%s.%s?size=1024"
+_GUILD_IMAGE_URL = "%s/%s/%s/%s.%s?size=1024"
+_EVENT_COVER_URL = "%s/guild-events/%s/%s.png?size=1024"
+_ICON_URL = "%s/%s-icons/%s/%s.png?size=1024"
+_AVATAR_DECORATION_URL = "%s/avatar-decoration-presets/%s.png?size=96&passthrough=true"
+_BANNER_URL = "%s/banners/%s/%s.%s?size=1024"
+_ACTIVITY_ASSET_URL = "%s/app-assets/%s/%s.png"
+
 __all__ = (
     "Asset",
 )
 
 
 class Asset:
+    __slots__ = (
+        "_state",
+        "_url",
+        "_animated",
+        "_key",
+        "_etag",
+        "_cached",
+    )
+
     BASE = "https://cdn.discordapp.com"
     PROXY = "https://media.discordapp.net"
 
@@ -36,31 +63,90 @@ class Asset:
         self._animated: bool = animated
         self._key: str = key
 
+        self._etag: str | None = None
+        self._cached: bytes | None = None
+
     def __str__(self) -> str:
         return self._url
 
     def __repr__(self) -> str:
-        shorten = self._url.replace(self.BASE, "")
-        return f"<Asset url={shorten}>"
+        return f"<Asset url={self._url.removeprefix(self.BASE)}>"
 
-    async def fetch(self) -> bytes:
+    async def fetch(self, *, cache: bool = False) -> bytes:
         """
         Fetches the asset
 
+        Parameters
+        ----------
+        cache: `bool`
+            Whether to keep the data on the asset and revalidate it with the
+            ETag on the next fetch, returning the kept data if it did not change.
+            Defaults to `False`
+
         Returns
         -------
         `bytes`
             The asset data
         """
+        headers = {}
+        if cache and self._etag is not None:
+            headers["If-None-Match"] = self._etag
+
         r = await self._state.http.request(
-            "GET", self.url, res_method="read"
+            "GET", self.url, res_method="read",
+            headers=headers
         )
 
-        if r.status not in range(200, 300):
+        if r.status == 304 and self._cached is not None:
+            return self._cached
+
+        if not 200 <= r.status < 300:
             raise HTTPException(r)
 
+        if cache:
+            self._etag = r.headers.get("ETag", None)
+            self._cached = r.response
+
         return r.response
 
+    @classmethod
+    async def gather_fetch(
+        cls,
+        assets: Iterable["Asset"],
+        *,
+        concurrency: int = 20
+    ) -> list[bytes]:
+        """
+        Fetches multiple assets concurrently
+
+        Parameters
+        ----------
+        assets: `Iterable[Asset]`
+            The assets to fetch
+        concurrency: `int`
+            How many assets can be fetched at the same time, defaults to 20
+
+        Returns
+        -------
+        `list[bytes]`
+            The asset data, in the same order as the given assets
+
+        Raises
+        ------
+        `ValueError`
+            If concurrency is lower than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be 1 or higher")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch(asset: "Asset") -> bytes:
+            async with semaphore:
+                return await asset.fetch()
+
+        return await asyncio.gather(*[_fetch(a) for a in assets])
+
     async def save(self, path: str) -> int:
         """
         Fetches the file from the attachment URL and saves it locally to the path
@@ -76,9 +162,36 @@ class Asset:
         `int`
             The amount of bytes written to the file
         """
-        data = await self.fetch()
-        with open(path, "wb") as f:
-            return f.write(data)
+        async with self._state.http.stream("GET", self.url) as r:
+            if not 200 <= r.status < 300:
+                from .http import HTTPResponse
+                raise HTTPException(HTTPResponse(
+                    status=r.status,
+                    response=await r.text(),
+                    reason=r.reason,
+                    res_method="text",
+                    headers=r.headers
+                ))
+
+            # Download next to the target first, so a failed download
+            # does not leave a truncated file behind at the path
+            tmp_path = f"{path}.part"
+            written = 0
+
+            try:
+                with open(tmp_path, "wb") as f:
+                    # Write in chunks to avoid keeping the whole asset in memory
+                    async for chunk in r.content.iter_chunked(65536):
+                        written += f.write(chunk)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+        os.replace(tmp_path, path)
+        return written
 
     def replace(
         self,
@@ -101,18 +214,42 @@ class Asset:
         `Self`
             The new asset object
         """
-        url = yarl.URL(self.url)
-        path, _ = os.path.splitext(url.path)
+        if format is MISSING and size is not MISSING:
+            # Only the size changes, no need to parse the URL for that
+            url = f"{self._url.partition('?')[0]}?size={size}"
+            return self.__class__(
+                state=self._state,
+                url=url,
+                key=self._key,
+                animated=self._animated
+            )
+
+        if format is not MISSING and size is MISSING:
+            # Only the extension changes, like yarl's with_path this drops the query
+            folder, _, filename = self._url.partition("?")[0].rpartition("/")
+            url = f"{folder}/{filename.rsplit('.', 1)[0]}.{format}"
+            return self.__class__(
+                state=self._state,
+                url=url,
+                key=self._key,
+                animated=self._animated
+            )
+
+        parts = urlsplit(self._url)
+        path, query = parts.path, parts.query
 
         if format is not MISSING:
-            url = url.with_path(f"{path}.{format}")
+            folder, _, filename = path.rpartition("/")
+            path = f"{folder}/{filename.rsplit('.', 1)[0]}.{format}"
 
         if size is not MISSING:
-            url = url.with_query(size=size)
-        else:
-            url = url.with_query(url.raw_query_string)
+            query = urlencode({"size": size})
+
+        url = urlunsplit((
+            parts.scheme, parts.netloc,
+            path, query, parts.fragment
+        ))
 
-        url = str(url)
         return self.__class__(
             state=self._state,
             url=url,
@@ -174,21 +311,35 @@ class Asset:
         return self._animated
 
     @classmethod
-    def _from_avatar(
+    def _from_hash(
         cls,
         state: "DiscordAPI",
-        user_id: int,
-        avatar: str
+        template: str,
+        hash: str,
+        *args: int | str
     ) -> Self:
-        animated = avatar.startswith("a_")
-        format = "gif" if animated else "png"
+        """
+        Creates an asset that can be animated from a URL template,
+        the template is formatted with BASE, args, hash and format in that order
+        """
+        animated = hash.startswith(_ANIMATED_PREFIX)
+        format = _ANIMATED_FORMAT if animated else _STATIC_FORMAT
         return cls(
             state=state,
-            url=f"{cls.BASE}/avatars/{user_id}/{avatar}.{format}?size=1024",
-            key=avatar,
+            url=template % (cls.BASE, *args, hash, format),
+            key=hash,
             animated=animated
         )
 
+    @classmethod
+    def _from_avatar(
+        cls,
+        state: "DiscordAPI",
+        user_id: int,
+        avatar: str
+    ) -> Self:
+        return cls._from_hash(state, _AVATAR_URL, avatar, user_id)
+
     @classmethod
     def _from_default_avatar(
         cls,
@@ -197,7 +348,7 @@ class Asset:
     ) -> Self:
         return cls(
             state=state,
-            url=f"{cls.BASE}/embed/avatars/{num}.png",
+            url=_DEFAULT_AVATAR_URL % (cls.BASE, num),
             key=str(num)
         )
 
@@ -209,14 +360,7 @@ class Asset:
         member_id: int,
         avatar: str
     ) -> Self:
-        animated = avatar.startswith("a_")
-        format = "gif" if animated else "png"
-        return cls(
-            state=state,
-            url=f"{cls.BASE}/guilds/{guild_id}/users/{member_id}/avatars/{avatar}.{format}?size=1024",
-            key=avatar,
-            animated=animated
-        )
+        return cls._from_hash(state, _GUILD_AVATAR_URL, avatar, guild_id, member_id)
 
     @classmethod
     def _from_guild_image(
@@ -226,14 +370,7 @@ class Asset:
         image: str,
         path: str
     ) -> Self:
-        animated = image.startswith("a_")
-        format = "gif" if animated else "png"
-        return cls(
-            state=state,
-            url=f"{cls.BASE}/{path}/{guild_id}/{image}.{format}?size=1024",
-            key=image,
-            animated=animated,
-        )
+        return cls._from_hash(state, _GUILD_IMAGE_URL, image, path, guild_id)
 
     @classmethod
     def _from_scheduled_event_cover_image(
@@ -244,7 +381,7 @@ class Asset:
     ) -> Self:
         return cls(
             state=state,
-            url=f"{cls.BASE}/guild-events/{scheduled_event_id}/{cover_image}.png?size=1024",
+            url=_EVENT_COVER_URL % (cls.BASE, scheduled_event_id, cover_image),
             key=cover_image,
             animated=False,
         )
@@ -259,7 +396,7 @@ class Asset:
     ) -> Self:
         return cls(
             state=state,
-            url=f"{cls.BASE}/{path}-icons/{object_id}/{icon_hash}.png?size=1024",
+            url=_ICON_URL % (cls.BASE, path, object_id, icon_hash),
             key=icon_hash,
             animated=False,
         )
@@ -270,14 +407,10 @@ class Asset:
         state: "DiscordAPI",
         decoration: str
     ) -> Self:
-        animated = (
-            decoration.startswith("v2_a_") or
-            decoration.startswith("a_")
-        )
-
+        animated = decoration.startswith(_DECORATION_ANIMATED_PREFIXES)
         return cls(
             state=state,
-            url=f"{cls.BASE}/avatar-decoration-presets/{decoration}.png?size=96&passthrough=true",
+            url=_AVATAR_DECORATION_URL % (cls.BASE, decoration),
             key=decoration,
             animated=animated
         )
@@ -289,14 +422,7 @@ class Asset:
         user_id: int,
         banner: str
     ) -> Self:
-        animated = banner.startswith("a_")
-        format = "gif" if animated else "png"
-        return cls(
-            state=state,
-            url=f"{cls.BASE}/banners/{user_id}/{banner}.{format}?size=1024",
-            key=banner,
-            animated=animated
-        )
+        return cls._from_hash(state, _BANNER_URL, banner, user_id)
 
     @classmethod
     def _from_activity_asset(
@@ -305,7 +431,7 @@ class Asset:
         activity_id: int,
         image: str
     ) -> Self:
-        url = f"{cls.BASE}/app-assets/{activity_id}/{image}.png"
+        url = _ACTIVITY_ASSET_URL % (cls.BASE, activity_id, image)
         if image.startswith("mp:"):
             url = f"{cls.PROXY}/{image}"
 
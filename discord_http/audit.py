@@ -1,6 +1,7 @@
 import logging
+import sys
 
-from typing import TYPE_CHECKING, Any, TypeVar, Type, Callable
+from typing import TYPE_CHECKING, Any, TypeVar, Type, Callable, ClassVar, Generic
 from datetime import datetime
 
 from . import utils, enums, flags
@@ -26,37 +27,48 @@ __all__ = (
 
 
 def _handle_snowflake(entry: "AuditLogEntry", data: int) -> Snowflake:
-    return Snowflake(id=int(data))
+    # Snowflake already takes care of the int conversion
+    return Snowflake(id=data)
+
+
+_TYPE_PREFIXES: tuple[tuple[str, Callable[[Any], Any]], ...] = (
+    ("sticker_", enums.StickerType),
+    ("webhook_", enums.WebhookType),
+    # Might use enums.IntegrationType in the future, not sure yet
+    ("integration_", lambda data: data),
+    ("channel_overwrite_", enums.PermissionType),
+)
+
+# Resolved once per action type, instead of matching name prefixes per change.
+# Keyed by value, since BaseEnum overrides __eq__ and is not hashable
+_TYPE_TRANSLATORS: dict[int, Callable[[Any], Any]] = {
+    action.value: next(
+        (cls for prefix, cls in _TYPE_PREFIXES if action.name.startswith(prefix)),
+        enums.ChannelType
+    )
+    for action in enums.AuditLogType
+}
 
 
 def _handle_type(entry: "AuditLogEntry", data: int | str) -> (
     enums.ChannelType | enums.StickerType |
     enums.WebhookType | enums.PermissionType | str
 ):
-    if entry.action_type.name.startswith("sticker_"):
-        return enums.StickerType(data)
-    elif entry.action_type.name.startswith("webhook_"):
-        return enums.WebhookType(data)
-    elif entry.action_type.name.startswith("integration_"):
-        # Might use enums.IntegrationType in the future, not sure yet
-        return data  # type: ignore
-    elif entry.action_type.name.startswith("channel_overwrite_"):
-        return enums.PermissionType(data)
-    else:
-        return enums.ChannelType(data)
+    return _TYPE_TRANSLATORS[entry.action_type.value](data)
 
 
-def _handle_overloaded_flags(entry: "AuditLogEntry", data: int) -> flags.BaseFlag | int:
-    _valid_types = (
-        enums.AuditLogType.channel_create,
-        enums.AuditLogType.channel_update,
-        enums.AuditLogType.channel_delete,
-        enums.AuditLogType.thread_create,
-        enums.AuditLogType.thread_update,
-        enums.AuditLogType.thread_delete,
-    )
+_CHANNEL_FLAG_ACTIONS: frozenset[int] = frozenset({
+    enums.AuditLogType.channel_create.value,
+    enums.AuditLogType.channel_update.value,
+    enums.AuditLogType.channel_delete.value,
+    enums.AuditLogType.thread_create.value,
+    enums.AuditLogType.thread_update.value,
+    enums.AuditLogType.thread_delete.value,
+})
+
 
-    if entry.action_type in _valid_types:
+def _handle_overloaded_flags(entry: "AuditLogEntry", data: int) -> flags.BaseFlag | int:
+    if entry.action_type.value in _CHANNEL_FLAG_ACTIONS:
         return flags.ChannelFlags(data)
     return data
 
@@ -109,14 +121,15 @@ def _handle_guild_id(entry: "AuditLogEntry", data: str | None) -> PartialGuild |
 def _handle_timestamp(entry: "AuditLogEntry", data: str | None) -> datetime | None:
     if not data:
         return None
+
+    if isinstance(data, str):
+        # Discord sends ISO 8601, which fromisoformat parses directly
+        return datetime.fromisoformat(data)
     return utils.parse_time(data)
 
 
 def _handle_applied_tags(entry: "AuditLogEntry", data: list[str]) -> list[Snowflake]:
-    return [
-        Snowflake(id=int(g))
-        for g in data
-    ]
+    return [Snowflake(id=g) for g in data]
 
 
 def _handle_forum_tags(entry: "AuditLogEntry", data: list[dict]) -> list[ForumTag]:
@@ -159,40 +172,60 @@ def _handle_avatar(entry: "AuditLogEntry", data: str | None) -> Asset | None:
     )
 
 
+# Overwrite type -> (guild getter for the target, PermissionType)
+_OVERWRITE_RESOLVERS: dict[str | int, tuple[str, enums.PermissionType]] = {
+    "0": ("get_partial_role", enums.PermissionType.role),
+    "1": ("get_partial_member", enums.PermissionType.member),
+    0: ("get_partial_role", enums.PermissionType.role),
+    1: ("get_partial_member", enums.PermissionType.member),
+}
+
+
 def _handle_overwrites(entry: "AuditLogEntry", data: dict) -> list[tuple[
     PartialUser | PartialRole, flags.PermissionOverwrite
 ]]:
+    # Bound once, since overwrites can easily be hundreds of items long
+    guild = entry.guild
+    partial_cache = entry._partial_cache
+    permissions = flags.Permissions
+    permission_overwrite = flags.PermissionOverwrite
+
     overwrites = []
-    for g in data:
-        allow = flags.Permissions(int(g["allow"]))
-        deny = flags.Permissions(int(g["deny"]))
+    append = overwrites.append
 
-        target = None
+    for g in data:
         ow_type = g["type"]
         ow_id = int(g["id"])
 
-        if ow_type == "0":
-            target = entry.guild.get_partial_role(ow_id)
-        elif ow_type == "1":
-            target = entry.guild.get_partial_member(ow_id)
+        try:
+            getter, target_type = _OVERWRITE_RESOLVERS[ow_type]
+        except KeyError:
+            raise ValueError(f"Unknown permission overwrite type: {ow_type}") from None
+
+        target = getattr(guild, getter)(ow_id)
 
         if target is None:
-            target = Snowflake(id=ow_id)
+            target = partial_cache.get((Snowflake, ow_id), None)
 
-        ow = flags.PermissionOverwrite(
-            target=target,
-            allow=allow,
-            deny=deny,
-            target_type=enums.PermissionType(int(ow_type))
-        )
+        if target is None:
+            partial_cache[(Snowflake, ow_id)] = target = Snowflake(id=ow_id)
 
-        overwrites.append((target, ow))
+        append((target, permission_overwrite(
+            target=target,
+            allow=permissions(int(g["allow"])),
+            deny=permissions(int(g["deny"])),
+            target_type=target_type
+        )))
 
     return overwrites
 
 
+def _handle_locale(entry: "AuditLogEntry", data: str) -> enums.Locale:
+    return enums.Locale(data)
+
+
 def _handle_colour(entry: "AuditLogEntry", data: int) -> Colour:
-    return Colour(int(data))
+    return Colour(data if type(data) is int else int(data))
 
 
 def _handle_automod_triggers(entry: "AuditLogEntry", data: dict) -> AutoModRuleTriggers:
@@ -207,94 +240,80 @@ def _handle_automod_actions(entry: "AuditLogEntry", data: list[dict]) -> list[Au
 
 
 def _handle_automod_roles(entry: "AuditLogEntry", data: list[int]) -> list[PartialRole]:
-    return [
-        entry._convert_target_role(g)
-        for g in data
-    ]
+    convert = entry._convert_target_role
+    return [convert(g) for g in data]
 
 
 def _handle_automod_channels(entry: "AuditLogEntry", data: list[int]) -> list[PartialChannel]:
-    return [
-        entry._convert_target_channel(g)
-        for g in data
-    ]
-
-
-def _handle_member(entry: "AuditLogEntry", data: int) -> User | PartialUser:
-    return entry._convert_target_user(int(data))
+    convert = entry._convert_target_channel
+    return [convert(g) for g in data]
 
 
-def _handle_channel(entry: "AuditLogEntry", data: str) -> PartialChannel:
-    return entry._convert_target_channel(int(data))
+T = TypeVar("T", bound=enums.BaseEnum | flags.BaseFlag)
 
 
-def _handle_role(entry: "AuditLogEntry", data: str) -> PartialRole:
-    return entry._convert_target_role(int(data))
+class _IntConverter(Generic[T]):
+    """ Translator that converts the raw value to an enum or flag """
+    __slots__ = ("cls",)
 
+    def __init__(self, cls: Type[T]):
+        self.cls = cls
 
-E = TypeVar("E", bound=enums.BaseEnum)
-
-
-def _handle_enum(cls: Type[E]) -> Callable[["AuditLogEntry", str | int], E]:
-    def _handler(entry: "AuditLogEntry", data: str | int) -> E:
-        return cls(int(data))
-
-    return _handler
+    def __call__(self, entry: "AuditLogEntry", data: str | int) -> T:
+        # Values can already be integers, no need to convert those again
+        return self.cls(data if type(data) is int else int(data))
 
 
-F = TypeVar("F", bound=flags.BaseFlag)
+_ROLE_UPDATE_KEYS: frozenset[str] = frozenset({"$add", "$remove"})
 
 
-def _handle_flags(cls: Type[F]) -> Callable[["AuditLogEntry", str | int], F]:
-    def _handler(entry: "AuditLogEntry", data: str | int) -> F:
-        return cls(int(data))
-
-    return _handler
+class AuditChange:
+    __slots__ = (
+        "entry",
+        "key",
+        "_old_value",
+        "_new_value",
+        "_translated",
+    )
 
+    # Keys that are known, but their values are kept as-is
+    _noop_keys: ClassVar[frozenset[str]] = frozenset({
+        "rate_limit_per_user",
+        "default_thread_rate_limit_per_user",
+        "tags",
+    })
 
-class AuditChange:
-    _translaters: dict[str, Callable[["AuditLogEntry", Any], Any] | None] = {
-        "verification_level": _handle_enum(enums.VerificationLevel),
-        "explicit_content_filter": _handle_enum(enums.ContentFilterLevel),
-        "allow": _handle_flags(flags.Permissions),
-        "deny": _handle_flags(flags.Permissions),
-        "permissions": _handle_flags(flags.Permissions),
+    _translaters: ClassVar[dict[str, Callable[["AuditLogEntry", Any], Any]]] = {
+        "verification_level": _IntConverter(enums.VerificationLevel),
+        "explicit_content_filter": _IntConverter(enums.ContentFilterLevel),
+        "allow": _IntConverter(flags.Permissions),
+        "deny": _IntConverter(flags.Permissions),
+        "permissions": _IntConverter(flags.Permissions),
         "id": _handle_snowflake,
         "color": _handle_colour,
-        "owner_id": _handle_member,
-        "inviter_id": _handle_member,
-        "channel_id": _handle_channel,
-        "afk_channel_id": _handle_channel,
-        "system_channel_id": _handle_channel,
-        "system_channel_flags": _handle_flags(flags.SystemChannelFlags),
-        "widget_channel_id": _handle_channel,
-        "rules_channel_id": _handle_channel,
-        "public_updates_channel_id": _handle_channel,
+        "system_channel_flags": _IntConverter(flags.SystemChannelFlags),
         "permission_overwrites": _handle_overwrites,
         "splash_hash": _handle_guild_hash("splashes"),
         "banner_hash": _handle_guild_hash("banners"),
         "discovery_splash_hash": _handle_guild_hash("discovery-splashes"),
         "icon_hash": _hanndle_icon,
         "avatar_hash": _handle_avatar,
-        "rate_limit_per_user": None,
-        "default_thread_rate_limit_per_user": None,
         "guild_id": _handle_guild_id,
-        "tags": None,
-        "default_message_notifications": _handle_enum(enums.DefaultNotificationLevel),
-        "video_quality_mode": _handle_enum(enums.VideoQualityType),
-        "privacy_level": _handle_enum(enums.PrivacyLevelType),
-        "format_type": _handle_enum(enums.StickerFormatType),
+        "default_message_notifications": _IntConverter(enums.DefaultNotificationLevel),
+        "video_quality_mode": _IntConverter(enums.VideoQualityType),
+        "privacy_level": _IntConverter(enums.PrivacyLevelType),
+        "format_type": _IntConverter(enums.StickerFormatType),
         "type": _handle_type,
         "communication_disabled_until": _handle_timestamp,
-        "expire_behavior": _handle_enum(enums.ExpireBehaviour),
-        "mfa_level": _handle_enum(enums.MFALevel),
-        "status": _handle_enum(enums.ScheduledEventStatusType),
-        "entity_type": _handle_enum(enums.ScheduledEventEntityType),
-        "preferred_locale": _handle_enum(enums.Locale),
+        "expire_behavior": _IntConverter(enums.ExpireBehaviour),
+        "mfa_level": _IntConverter(enums.MFALevel),
+        "status": _IntConverter(enums.ScheduledEventStatusType),
+        "entity_type": _IntConverter(enums.ScheduledEventEntityType),
+        "preferred_locale": _handle_locale,
         "image_hash": _handle_cover_image,
-        "trigger_type": _handle_enum(enums.AutoModRuleTriggerType),
+        "trigger_type": _IntConverter(enums.AutoModRuleTriggerType),
         "trigger_metadata": _handle_automod_triggers,
-        "event_type": _handle_enum(enums.AutoModRuleEventType),
+        "event_type": _IntConverter(enums.AutoModRuleEventType),
         "actions": _handle_automod_actions,
         "exempt_channels": _handle_automod_channels,
         "exempt_roles": _handle_automod_roles,
@@ -304,6 +323,8 @@ class AuditChange:
         "default_reaction_emoji": _handle_default_reaction,
     }
 
+    _get_translator = _translaters.get
+
     def __init__(
         self,
         *,
@@ -312,36 +333,92 @@ class AuditChange:
     ):
         self.entry = entry
 
-        self.key: str = data["key"]
+        # Keys repeat a lot across entries, so share one string per key
+        self.key: str = sys.intern(data["key"])
 
-        self.old_value: Any | None = data.get("old_value", None)
-        self.new_value: Any | None = data.get("new_value", None)
+        # Raw values are only translated once they are accessed
+        self._old_value: Any | None = data.get("old_value", None)
+        self._new_value: Any | None = data.get("new_value", None)
+        self._translated: bool = False
 
-        if self.key in ("$add", "$remove"):
-            self.new_value = self._handle_partial_role(data)
+    @property
+    def old_value(self) -> Any | None:
+        """ `Any | None`: The value before the change, if any """
+        if not self._translated:
+            self._translate()
+        return self._old_value
+
+    @old_value.setter
+    def old_value(self, value: Any | None) -> None:
+        # Translate first, so the other value is not left raw and this one is not translated again
+        if not self._translated:
+            self._translate()
+        self._old_value = value
+
+    @property
+    def new_value(self) -> Any | None:
+        """ `Any | None`: The value after the change, if any """
+        if not self._translated:
+            self._translate()
+        return self._new_value
+
+    @new_value.setter
+    def new_value(self, value: Any | None) -> None:
+        if not self._translated:
+            self._translate()
+        self._new_value = value
+
+    def _translate(self) -> None:
+        self._translated = True
+
+        if self.key in _ROLE_UPDATE_KEYS:
+            self._new_value = self._handle_partial_role(self._new_value or [])
             return
 
-        _translator: Callable[["AuditLogEntry", Any], Any] | None = self._translaters.get(self.key, None)
+        if self.key in self._noop_keys:
+            return
+
+        _translator = AuditChange._get_translator(self.key)
 
         if _translator:
-            if self.new_value is not None:
-                self.new_value = _translator(self.entry, self.new_value)
+            if self._new_value is not None:
+                self._new_value = _translator(self.entry, self._new_value)
 
-            if self.old_value is not None:
-                self.old_value = _translator(self.entry, self.old_value)
+            if self._old_value is not None:
+                self._old_value = _translator(self.entry, self._old_value)
 
-    def _handle_partial_role(self, data: dict) -> list[PartialRole]:
+    def _handle_partial_role(self, data: list[dict]) -> list[PartialRole]:
         return [
             PartialRole(
                 state=self.entry._state,
                 id=int(g["id"]),
                 guild_id=self.entry.guild.id
             )
-            for g in data["new_value"]
+            for g in data
         ]
 
 
+_ACTION_TYPES: dict[int, enums.AuditLogType] = {
+    g.value: g for g in enums.AuditLogType
+}
+
+P = TypeVar("P", PartialGuild, PartialChannel, PartialUser, PartialRole)
+
+
 class AuditLogEntry(Snowflake):
+    __slots__ = (
+        "_state",
+        "guild",
+        "action_type",
+        "reason",
+        "user_id",
+        "target_id",
+        "options",
+        "changes",
+        "_users",
+        "_partial_cache",
+    )
+
     def __init__(
         self,
         *,
@@ -358,12 +435,13 @@ class AuditLogEntry(Snowflake):
             id=int(data["guild_id"])
         )
 
-        try:
-            self.action_type: enums.AuditLogType = enums.AuditLogType(int(data["action_type"]))
-        except ValueError:
+        action_type = _ACTION_TYPES.get(int(data["action_type"]), None)
+        if action_type is None:
             # There might be a new audit log type added
             _log.debug(f"Unknown audit log type detected from guild {self.guild.id}: {data['action_type']}")
-            self.action_type = enums.AuditLogType.unknown
+            action_type = enums.AuditLogType.unknown
+
+        self.action_type: enums.AuditLogType = action_type
 
         self.reason: str | None = data.get("reason", None)
 
@@ -372,10 +450,12 @@ class AuditLogEntry(Snowflake):
 
         # TODO: Add parsing methods for options
         self.options: dict = data.get("options", {})
-        self.changes: list[AuditChange] = []
 
         self._users: dict[int, User] = users or {}
 
+        # Partial objects are reused when the same ID shows up more than once
+        self._partial_cache: dict[tuple[type, int], Any] = {}
+
         self._from_data(data)
 
     def __repr__(self) -> str:
@@ -386,7 +466,7 @@ class AuditLogEntry(Snowflake):
     def _from_data(self, data: dict) -> None:
         self.changes: list[AuditChange] = [
             AuditChange(entry=self, data=g)
-            for g in data.get("changes", [])
+            for g in data.get("changes", ())
         ]
 
     @property
@@ -407,38 +487,76 @@ class AuditLogEntry(Snowflake):
         if not self.target_id:
             return None
 
-        try:
-            converter = getattr(self, f"_convert_target_{self.action_type.target_type}")
-        except AttributeError:
+        target_type = self.action_type.target_type
+        converter = None
+        if target_type is not None:
+            converter = self._target_converters.get(target_type, None)
+
+        if converter is None:
             return Snowflake(id=self.target_id)
-        else:
-            return converter(self.target_id)
 
-    def _convert_target_guild(self, guild_id: int) -> PartialGuild:
-        return PartialGuild(
-            state=self._state,
-            id=guild_id
-        )
+        return converter(self, self.target_id)
 
-    def _convert_target_channel(self, channel_id: int) -> PartialChannel:
-        return PartialChannel(
-            state=self._state,
-            id=channel_id,
+    def _get_partial(self, cls: Type[P], id: int | str, **kwargs) -> P:
+        id = int(id)
+        key = (cls, id)
+        try:
+            value = self._partial_cache[key]
+        except KeyError:
+            self._partial_cache[key] = value = cls(
+                state=self._state,
+                id=id,
+                **kwargs
+            )
+
+        return value
+
+    # The converters below are also used directly as change translators,
+    # so they accept the raw string IDs from the API as well
+
+    def _convert_target_guild(self, guild_id: int | str) -> PartialGuild:
+        return self._get_partial(PartialGuild, guild_id)
+
+    def _convert_target_channel(self, channel_id: int | str) -> PartialChannel:
+        return self._get_partial(
+            PartialChannel, channel_id,
             guild_id=self.guild.id
         )
 
-    def _convert_target_user(self, user_id: int) -> User | PartialUser:
-        return self._users.get(user_id, PartialUser(
-            state=self._state,
-            id=user_id
-        ))
+    def _convert_target_user(self, user_id: int | str) -> User | PartialUser:
+        user_id = int(user_id)
+        user = self._users.get(user_id, None)
+        if user is not None:
+            return user
+        return self._get_partial(PartialUser, user_id)
 
-    def _convert_target_role(self, role_id: int) -> PartialRole:
-        return PartialRole(
-            state=self._state,
-            id=role_id,
+    def _convert_target_role(self, role_id: int | str) -> PartialRole:
+        return self._get_partial(
+            PartialRole, role_id,
             guild_id=self.guild.id
         )
 
-    def _convert_target_message(self, user_id: int) -> User | PartialUser:
+    def _convert_target_message(self, user_id: int | str) -> User | PartialUser:
         return self._convert_target_user(user_id)
+
+    # Target type (AuditLogType.target_type) -> converter
+    _target_converters: ClassVar[dict[str, Callable[["AuditLogEntry", int], Any]]] = {
+        "guild": _convert_target_guild,
+        "channel": _convert_target_channel,
+        "user": _convert_target_user,
+        "role": _convert_target_role,
+        "message": _convert_target_message,
+    }
+
+
+# ID changes go straight to the entry converters, no wrapper needed
+AuditChange._translaters.update({
+    "owner_id": AuditLogEntry._convert_target_user,
+    "inviter_id": AuditLogEntry._convert_target_user,
+    "channel_id": AuditLogEntry._convert_target_channel,
+    "afk_channel_id": AuditLogEntry._convert_target_channel,
+    "system_channel_id": AuditLogEntry._convert_target_channel,
+    "widget_channel_id": AuditLogEntry._convert_target_channel,
+    "rules_channel_id": AuditLogEntry._convert_target_channel,
+    "public_updates_channel_id": AuditLogEntry._convert_target_channel,
+})
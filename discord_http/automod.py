@@ -1,3 +1,5 @@
+import re
+
 from typing import TYPE_CHECKING, Self, Any
 
 from . import utils
@@ -16,6 +18,17 @@ if TYPE_CHECKING:
 
 MISSING = utils.MISSING
 
+# Value lookups, a dict hit is cheaper than going through Enum.__call__
+_EVENT_TYPES: dict[int, AutoModRuleEventType] = {
+    g.value: g for g in AutoModRuleEventType
+}
+_TRIGGER_TYPES: dict[int, AutoModRuleTriggerType] = {
+    g.value: g for g in AutoModRuleTriggerType
+}
+_ACTION_TYPES: dict[int, AutoModRuleActionType] = {
+    g.value: g for g in AutoModRuleActionType
+}
+
 __all__ = (
     "AutoModRuleTriggers",
     "AutoModRuleAction",
@@ -24,7 +37,37 @@ __all__ = (
 )
 
 
+# Leading inline flags, like (?i) or (?i-s), which only apply to the whole pattern
+_leading_flags = re.compile(r"\(\?([a-zA-Z]*(?:-[a-zA-Z]+)?)\)")
+
+
+def _scope_inline_flags(pattern: str) -> str:
+    """
+    Rewrites leading global flags into a scoped group,
+    `(?i)foo` becomes `(?i:foo)` so it can be joined with other patterns
+    """
+    flags = []
+    while (m := _leading_flags.match(pattern)):
+        flags.append(m.group(1))
+        pattern = pattern[m.end():]
+
+    for g in reversed(flags):
+        pattern = f"(?{g}:{pattern})"
+    return pattern
+
+
 class AutoModRuleTriggers:
+    __slots__ = (
+        "keyword_filter",
+        "regex_patterns",
+        "presets",
+        "allow_list",
+        "mention_total_limit",
+        "mention_raid_protection_enabled",
+        "_regex_matcher",
+        "_keyword_matcher",
+    )
+
     def __init__(
         self,
         *,
@@ -42,41 +85,163 @@ class AutoModRuleTriggers:
         self.mention_total_limit: int | None = mention_total_limit
         self.mention_raid_protection_enabled: bool = mention_raid_protection_enabled
 
+        self._regex_matcher: tuple[tuple[str, ...], re.Pattern[str]] | None = None
+        self._keyword_matcher: tuple[
+            tuple[str, ...], re.Pattern[str], tuple[re.Pattern[str], ...]
+        ] | None = None
+
     def __repr__(self) -> str:
-        output = "<AutoModTriggers "
+        parts = []
 
         if self.keyword_filter:
-            output += f"keyword_filter={self.keyword_filter}"
+            parts.append(f"keyword_filter={self.keyword_filter}")
         if self.regex_patterns:
-            output += f"regex_patterns={self.regex_patterns}"
+            parts.append(f"regex_patterns={self.regex_patterns}")
         if self.presets:
-            output += f"presets={self.presets}"
+            parts.append(f"presets={self.presets}")
         if self.allow_list:
-            output += f"allow_list={self.allow_list}"
+            parts.append(f"allow_list={self.allow_list}")
         if self.mention_total_limit:
-            output += f"mention_total_limit={self.mention_total_limit}"
+            parts.append(f"mention_total_limit={self.mention_total_limit}")
         if self.mention_raid_protection_enabled:
-            output += "mention_raid_protection_enabled=True"
+            parts.append("mention_raid_protection_enabled=True")
+
+        return f"<AutoModTriggers {' '.join(parts)}>"
+
+    def compile_matcher(self) -> re.Pattern[str] | None:
+        """
+        Compiles all the regex patterns into one pattern,
+        useful to test messages locally without going through every pattern
+
+        The pattern is cached until regex_patterns changes.
+        Leading flags such as `(?i)` only apply to the pattern they belong to.
+        Note that Discord uses Rust regex syntax, which Python's `re` supports for most patterns.
+        Python's `re` is a backtracking engine, so unlike Discord it does not
+        guarantee linear-time matching, avoid running untrusted patterns on large texts
+
+        Returns
+        -------
+        `re.Pattern[str] | None`
+            The compiled pattern, or `None` if there are no regex patterns
+
+        Raises
+        ------
+        `re.error`
+            If one of the patterns is not valid for Python's `re`
+        """
+        if not self.regex_patterns:
+            return None
+
+        patterns = tuple(self.regex_patterns)
+        if self._regex_matcher is not None and self._regex_matcher[0] == patterns:
+            return self._regex_matcher[1]
+
+        compiled = re.compile("|".join(f"(?:{_scope_inline_flags(g)})" for g in patterns))
+        self._regex_matcher = (patterns, compiled)
+        return compiled
+
+    def compile_keyword_matcher(self) -> re.Pattern[str] | None:
+        """
+        Compiles all the keywords into one case-insensitive pattern,
+        so a message can be scanned once instead of once per keyword
+
+        Wildcards follow Discord's rules, `cat` only matches the whole word,
+        `cat*` matches words starting with it, `*cat` words ending with it
+        and `*cat*` matches it anywhere.
+        Each keyword gets its own group, in the same order as keyword_filter.
+
+        The pattern is cached until keyword_filter changes.
+
+        Returns
+        -------
+        `re.Pattern[str] | None`
+            The compiled pattern, or `None` if there are no keywords
+        """
+        if not self.keyword_filter:
+            return None
+
+        keywords = tuple(self.keyword_filter)
+        if self._keyword_matcher is not None and self._keyword_matcher[0] == keywords:
+            return self._keyword_matcher[1]
+
+        parts = []
+        for keyword in keywords:
+            pattern = re.escape(keyword.strip("*"))
+            if not keyword.startswith("*"):
+                pattern = rf"(?<!\w){pattern}"
+            if not keyword.endswith("*"):
+                pattern = rf"{pattern}(?!\w)"
+            parts.append(pattern)
+
+        compiled = re.compile("|".join(f"({g})" for g in parts), re.IGNORECASE)
+        self._keyword_matcher = (
+            keywords, compiled,
+            tuple(re.compile(g, re.IGNORECASE) for g in parts)
+        )
+        return compiled
+
+    def match_keywords(self, text: str) -> list[str]:
+        """
+        Get the keywords from keyword_filter that are found in the text
+
+        This does not take allow_list into account
+
+        Parameters
+        ----------
+        text: `str`
+            The text to check
 
-        return f"{output}>"
+        Returns
+        -------
+        `list[str]`
+            The keywords that matched, without duplicates
+        """
+        matcher = self.compile_keyword_matcher()
+        if matcher is None or self._keyword_matcher is None:
+            return []
+
+        # One scan to rule out texts without any keyword, which is the common case
+        first = matcher.search(text)
+        if first is None:
+            return []
+
+        # Keywords can overlap ("cat" and "cat dog"), so each one is checked on its own,
+        # nothing can match before the first hit of the combined pattern
+        keywords, _, patterns = self._keyword_matcher
+        return list(dict.fromkeys(
+            keyword
+            for keyword, pattern in zip(keywords, patterns)
+            if pattern.search(text, first.start())
+        ))
 
     def to_dict(self) -> dict:
-        payload = {}
+        payload = {
+            "keyword_filter": (
+                list(self.keyword_filter)
+                if self.keyword_filter is not None else None
+            ),
+            "regex_patterns": (
+                list(self.regex_patterns)
+                if self.regex_patterns is not None else None
+            ),
+            "presets": (
+                [int(g) for g in self.presets]
+                if self.presets is not None else None
+            ),
+            "allow_list": (
+                list(self.allow_list)
+                if self.allow_list is not None else None
+            ),
+            "mention_total_limit": (
+                int(self.mention_total_limit)
+                if self.mention_total_limit is not None else None
+            ),
+            "mention_raid_protection_enabled": (
+                True if self.mention_raid_protection_enabled is True else None
+            ),
+        }
 
-        if self.keyword_filter is not None:
-            payload["keyword_filter"] = [str(g) for g in self.keyword_filter]
-        if self.regex_patterns is not None:
-            payload["regex_patterns"] = [str(g) for g in self.regex_patterns]
-        if self.presets is not None:
-            payload["presets"] = [int(g) for g in self.presets]
-        if self.allow_list is not None:
-            payload["allow_list"] = [str(g) for g in self.allow_list]
-        if self.mention_total_limit is not None:
-            payload["mention_total_limit"] = int(self.mention_total_limit)
-        if self.mention_raid_protection_enabled is True:
-            payload["mention_raid_protection_enabled"] = True
-
-        return payload
+        return {k: v for k, v in payload.items() if v is not None}
 
     @classmethod
     def from_dict(cls, data: dict) -> Self:
@@ -91,6 +256,13 @@ class AutoModRuleTriggers:
 
 
 class AutoModRuleAction:
+    __slots__ = (
+        "type",
+        "channel_id",
+        "duration_seconds",
+        "custom_message",
+    )
+
     def __init__(
         self,
         *,
@@ -109,38 +281,43 @@ class AutoModRuleAction:
             self.duration_seconds = min(self.duration_seconds, 2419200)
 
     def __repr__(self) -> str:
-        output = f"<AutoModAction type={self.type}"
+        parts = [f"type={self.type}"]
+
         if self.channel_id:
-            output += f" channel_id={self.channel_id}"
+            parts.append(f"channel_id={self.channel_id}")
         if self.duration_seconds:
-            output += f" duration_seconds={self.duration_seconds}"
+            parts.append(f"duration_seconds={self.duration_seconds}")
         if self.custom_message:
-            output += f" custom_message={self.custom_message}"
+            parts.append(f"custom_message={self.custom_message}")
 
-        return f"{output}>"
+        return f"<AutoModAction {' '.join(parts)}>"
 
     def to_dict(self) -> dict:
-        payload = {
+        return {
             "type": int(self.type),
-            "metadata": {}
+            "metadata": {
+                key: cast(value)
+                for key, value, cast in (
+                    ("channel_id", self.channel_id, str),
+                    ("duration_seconds", self.duration_seconds, int),
+                    ("custom_message", self.custom_message, str),
+                )
+                if value is not None
+            }
         }
 
-        if self.channel_id is not None:
-            payload["metadata"]["channel_id"] = str(self.channel_id)
-
-        if self.duration_seconds is not None:
-            payload["metadata"]["duration_seconds"] = int(self.duration_seconds)
-
-        if self.custom_message is not None:
-            payload["metadata"]["custom_message"] = self.custom_message
-
-        return payload
-
     @classmethod
     def from_dict(cls, data: dict) -> Self:
         _metadata = data.get("metadata", {})
+
+        try:
+            action_type = _ACTION_TYPES[data["type"]]
+        except KeyError:
+            # Unknown value, let the enum handle it
+            action_type = AutoModRuleActionType(data["type"])
+
         return cls(
-            type=AutoModRuleActionType(data["type"]),
+            type=action_type,
             channel_id=utils.get_int(_metadata, "channel_id"),
             duration_seconds=_metadata.get("duration_seconds", None),
             custom_message=_metadata.get("custom_message", None)
@@ -167,8 +344,38 @@ class AutoModRuleAction:
             duration_seconds=int(seconds)
         )
 
+    # Same payloads as create_*().to_dict(), without building the object first
+
+    @staticmethod
+    def _message_payload(message: str) -> dict:
+        return {
+            "type": int(AutoModRuleActionType.block_message),
+            "metadata": {"custom_message": str(message)}
+        }
+
+    @staticmethod
+    def _alert_location_payload(channel: Snowflake | int) -> dict:
+        return {
+            "type": int(AutoModRuleActionType.send_alert_message),
+            "metadata": {"channel_id": str(int(channel))}
+        }
+
+    @staticmethod
+    def _timeout_payload(seconds: int) -> dict:
+        return {
+            "type": int(AutoModRuleActionType.timeout),
+            # 4 Week limit, same as in __init__
+            "metadata": {"duration_seconds": min(int(seconds), 2419200)}
+        }
+
 
 class PartialAutoModRule(PartialBase):
+    __slots__ = (
+        "_state",
+        "guild_id",
+        "_guild_fallback",
+    )
+
     def __init__(
         self,
         *,
@@ -181,6 +388,8 @@ class PartialAutoModRule(PartialBase):
 
         self.guild_id: int = guild_id
 
+        self._guild_fallback: "PartialGuild | None" = None
+
     def __repr__(self) -> str:
         return f"<PartialAutoModRule id={self.id}>"
 
@@ -194,8 +403,12 @@ class PartialAutoModRule(PartialBase):
         if cache:
             return cache
 
-        from .guild import PartialGuild
-        return PartialGuild(state=self._state, id=self.guild_id)
+        # Reuse the same partial guild on repeated reads
+        if self._guild_fallback is None:
+            from .guild import PartialGuild
+            self._guild_fallback = PartialGuild(state=self._state, id=self.guild_id)
+
+        return self._guild_fallback
 
     async def fetch(self) -> "AutoModRule":
         """ `AutoModRule`: Fetches more information about the automod rule """
@@ -292,31 +505,32 @@ class PartialAutoModRule(PartialBase):
         if event_type is not MISSING:
             payload["event_type"] = int(event_type or -1)
 
-        if any([
-            g is not MISSING
-            for g in [alert_channel, timeout_seconds, message]
-        ]):
+        if (
+            alert_channel is not MISSING or
+            timeout_seconds is not MISSING or
+            message is not MISSING
+        ):
             payload["actions"] = []
 
         if alert_channel is not MISSING:
             payload["actions"].append(
-                AutoModRuleAction.create_alert_location(
+                AutoModRuleAction._alert_location_payload(
                     int(alert_channel or -1)
-                ).to_dict()
+                )
             )
 
         if timeout_seconds is not MISSING:
             payload["actions"].append(
-                AutoModRuleAction.create_timeout(
+                AutoModRuleAction._timeout_payload(
                     int(timeout_seconds or -1)
-                ).to_dict()
+                )
             )
 
         if message is not MISSING:
             payload["actions"].append(
-                AutoModRuleAction.create_message(
+                AutoModRuleAction._message_payload(
                     str(message)
-                ).to_dict()
+                )
             )
 
         if enabled is not MISSING:
@@ -359,6 +573,20 @@ class PartialAutoModRule(PartialBase):
 
 
 class AutoModRule(PartialAutoModRule):
+    __slots__ = (
+        "name",
+        "creator_id",
+        "event_type",
+        "trigger_type",
+        "actions",
+        "trigger_metadata",
+        "enabled",
+        "_exempt_role_ids",
+        "_exempt_channel_ids",
+        "_exempt_roles",
+        "_exempt_channels",
+    )
+
     def __init__(
         self,
         *,
@@ -373,29 +601,39 @@ class AutoModRule(PartialAutoModRule):
 
         self.name: str = data["name"]
         self.creator_id: int = int(data["creator_id"])
-        self.event_type: AutoModRuleEventType = AutoModRuleEventType(data["event_type"])
-        self.trigger_type: AutoModRuleTriggerType = AutoModRuleTriggerType(data["trigger_type"])
+        try:
+            self.event_type: AutoModRuleEventType = _EVENT_TYPES[data["event_type"]]
+        except KeyError:
+            self.event_type = AutoModRuleEventType(data["event_type"])
+
+        try:
+            self.trigger_type: AutoModRuleTriggerType = _TRIGGER_TYPES[data["trigger_type"]]
+        except KeyError:
+            self.trigger_type = AutoModRuleTriggerType(data["trigger_type"])
 
         self.actions: list[AutoModRuleAction] = [
             AutoModRuleAction.from_dict(g)
             for g in data["actions"]
         ]
 
-        self.trigger_metadata: AutoModRuleTriggers | None = None
+        trigger_metadata = data.get("trigger_metadata", None)
+        self.trigger_metadata: AutoModRuleTriggers | None = (
+            AutoModRuleTriggers.from_dict(trigger_metadata)
+            if trigger_metadata else None
+        )
 
         self.enabled: bool = data.get("enabled", False)
 
-        self.exempt_roles: list[PartialRole] = [
-            PartialRole(state=state, id=int(g), guild_id=self.guild_id)
-            for g in data.get("exempt_roles", [])
+        # The partial objects are only made once exempt_roles/exempt_channels is read
+        self._exempt_role_ids: list[int] = [
+            int(g) for g in data.get("exempt_roles", [])
         ]
-
-        self.exempt_channels: list[PartialChannel] = [
-            PartialChannel(state=state, id=int(g), guild_id=self.guild_id)
-            for g in data.get("exempt_channels", [])
+        self._exempt_channel_ids: list[int] = [
+            int(g) for g in data.get("exempt_channels", [])
         ]
 
-        self._from_data(data)
+        self._exempt_roles: list[PartialRole] | None = None
+        self._exempt_channels: list[PartialChannel] | None = None
 
     def __repr__(self) -> str:
         return f"<AutoModRule id={self.id} name={self.name}>"
@@ -403,11 +641,33 @@ class AutoModRule(PartialAutoModRule):
     def __str__(self) -> str:
         return self.name
 
-    def _from_data(self, data: dict) -> None:
-        if data.get("trigger_metadata", None):
-            self.trigger_metadata = AutoModRuleTriggers.from_dict(
-                data["trigger_metadata"]
-            )
+    @property
+    def exempt_roles(self) -> list[PartialRole]:
+        """ `list[PartialRole]`: The roles that are exempt from the automod rule """
+        if self._exempt_roles is None:
+            self._exempt_roles = [
+                PartialRole(state=self._state, id=g, guild_id=self.guild_id)
+                for g in self._exempt_role_ids
+            ]
+        return self._exempt_roles
+
+    @exempt_roles.setter
+    def exempt_roles(self, value: list[PartialRole]) -> None:
+        self._exempt_roles = value
+
+    @property
+    def exempt_channels(self) -> list[PartialChannel]:
+        """ `list[PartialChannel]`: The channels that are exempt from the automod rule """
+        if self._exempt_channels is None:
+            self._exempt_channels = [
+                PartialChannel(state=self._state, id=g, guild_id=self.guild_id)
+                for g in self._exempt_channel_ids
+            ]
+        return self._exempt_channels
+
+    @exempt_channels.setter
+    def exempt_channels(self, value: list[PartialChannel]) -> None:
+        self._exempt_channels = value
 
     @property
     def creator(self) -> PartialUser:
@@ -1,10 +1,10 @@
 import asyncio
-import copy
 import logging
 import signal
 import json
+import time
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from hypercorn.asyncio import serve
 from hypercorn.config import Config as HyperConfig
 from nacl.exceptions import BadSignatureError
@@ -13,7 +13,8 @@ from quart import Quart, request, abort
 from quart import Response as QuartResponse
 from quart.logging import default_handler
 from quart.utils import MustReloadError, restart
-from typing import Any, TYPE_CHECKING
+from werkzeug.exceptions import HTTPException as QuartHTTPException
+from typing import Any, Awaitable, Callable, TYPE_CHECKING
 
 from . import utils
 from .commands import Command, SubGroup
@@ -27,6 +28,15 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+# Same as Context.response.pong(), serialized once
+_PONG_BODY = b'{"type":1}'
+
+# Shutdown signals that exist on this platform, SIGBREAK is Windows only
+_SHUTDOWN_SIGNALS: tuple[signal.Signals, ...] = tuple(
+    getattr(signal, g) for g in ("SIGINT", "SIGTERM", "SIGBREAK")
+    if hasattr(signal, g)
+)
+
 __all__ = (
     "DiscordHTTP",
 )
@@ -68,9 +78,31 @@ class DiscordHTTP(Quart):
         We recommend to not touch this class, unless you know what you're doing
         """
         self.uptime: datetime = utils.utcnow()
+        # Monotonic clock is used for the uptime delta in index_ping
+        self._uptime_monotonic: float = time.monotonic()
 
         self.bot: "Client" = client
 
+        # Made on the first request and remade if public_key changes,
+        # stored as (public_key, VerifyKey)
+        self._verify_key: tuple[str, VerifyKey] | None = None
+
+        # Parts of index_ping that do not change once the bot is ready
+        self._ping_me: dict | None = None
+        self._ping_reboot_datetime: str = str(self.uptime.astimezone().isoformat())
+        self._ping_reboot_unix: int = int(self.uptime.timestamp())
+
+        # Interaction type value -> handler, looked up once per request
+        self._interaction_handlers: dict[
+            int, Callable[["Context", dict], Awaitable[QuartResponse | dict]]
+        ] = {
+            InteractionType.ping.value: self._handle_ack_ping,
+            InteractionType.application_command.value: self._handle_application_command,
+            InteractionType.message_component.value: self._handle_interaction,
+            InteractionType.modal_submit.value: self._handle_interaction,
+            InteractionType.application_command_autocomplete.value: self._handle_autocomplete,
+        }
+
         # Aliases
         self.loop = self.bot.loop
         self.debug_events = self.bot.debug_events
@@ -86,45 +118,60 @@ class DiscordHTTP(Quart):
         _quart_log.removeHandler(default_handler)
         _quart_log.setLevel(logging.CRITICAL)
 
-    async def _validate_request(self) -> None:
+    async def _validate_request(self) -> bytes:
         """
         Used to validate requests sent by Discord Webhooks
         This should NOT be modified, unless you know what you're doing
+
+        Returns the raw request body once it has been validated
         """
         if not self.bot.public_key:
             return abort(401, "invalid public key")
 
-        verify_key = VerifyKey(bytes.fromhex(self.bot.public_key))
+        public_key = self.bot.public_key
+        if self._verify_key is None or self._verify_key[0] != public_key:
+            self._verify_key = (public_key, VerifyKey(bytes.fromhex(public_key)))
+
+        verify_key = self._verify_key[1]
         signature: str = request.headers.get("X-Signature-Ed25519", "")
         timestamp: str = request.headers.get("X-Signature-Timestamp", "")
 
+        # Ed25519 signatures are 64 bytes (128 hex), reject before reading the body
+        if len(signature) != 128 or not timestamp:
+            return abort(401, "invalid request signature")
+
         try:
+            # Signed message is timestamp + raw body, no need to decode the body
             data = await request.data
-            body = data.decode("utf-8")
             verify_key.verify(
-                f"{timestamp}{body}".encode(),
+                timestamp.encode() + data,
                 bytes.fromhex(signature)
             )
         except BadSignatureError:
-            abort(401, "invalid request signature")
+            return abort(401, "invalid request signature")
         except Exception:
-            abort(400, "invalid request body")
+            return abort(400, "invalid request body")
+
+        return data
 
     def _dig_subcommand(
         self,
         cmd: Command | SubGroup,
-        data: dict
+        interaction_data: dict
     ) -> tuple[Command | None, list[dict]]:
         """
         Used to dig through subcommands to execute correct command/autocomplete
+        Takes the inner `data` object of the interaction
         """
-        data_options: list[dict] = data["data"].get("options", [])
+        data_options: list[dict] = interaction_data.get("options", [])
 
         while isinstance(cmd, SubGroup):
-            find_next_step = next((
-                g for g in data_options
-                if g.get("name", None) and not g.get("value", None)
-            ), None)
+            # Subcommands and groups are the only options without a value
+            find_next_step = None
+            for g in data_options:
+                if "value" not in g and "name" in g:
+                    find_next_step = g
+                    break
 
             if not find_next_step:
                 return abort(400, "invalid command")
@@ -133,8 +180,9 @@ class DiscordHTTP(Quart):
 
             if not cmd:
                 _log.warning(
-                    f"Unhandled subcommand: {find_next_step['name']} "
-                    "(not found in local command list)"
+                    "Unhandled subcommand: %s "
+                    "(not found in local command list)",
+                    find_next_step["name"]
                 )
                 return abort(404, "command not found")
 
@@ -142,20 +190,40 @@ class DiscordHTTP(Quart):
 
         return cmd, data_options
 
-    def _handle_ack_ping(
+    def _make_response(self, payload: BaseResponse | None) -> QuartResponse:
+        """
+        Used to turn a response into a Quart response.
+        Multipart is only needed when there are files to upload, the rest is sent as JSON.
+        A view callback without anything to call returns `None`, that is sent as an empty response
+        """
+        if payload is None:
+            payload = EmptyResponse()
+
+        if (
+            isinstance(payload, EmptyResponse) or
+            (isinstance(payload, MessageResponse) and payload.files)
+        ):
+            return QuartResponse(
+                payload.to_multipart(),
+                content_type=payload.content_type
+            )
+
+        return self.jsonify(payload.to_dict())
+
+    async def _handle_ack_ping(
         self,
         ctx: "Context",
         data: dict
-    ) -> dict:
+    ) -> QuartResponse:
         """ Used to handle ACK ping """
         _ping = Ping(state=self.bot.state, data=data)
 
         if self.bot.has_any_dispatch("ping"):
             self.bot.dispatch("ping", _ping)
 
-        _log.debug(f"Discord Interactions ACK recieved ({_ping.id})")
+        _log.debug("Discord Interactions ACK recieved (%s)", _ping.id)
 
-        return ctx.response.pong()
+        return QuartResponse(_PONG_BODY, mimetype="application/json")
 
     async def _handle_application_command(
         self,
@@ -165,20 +233,22 @@ class DiscordHTTP(Quart):
         """ Used to handle application commands """
         _log.debug("Received slash command, processing...")
 
-        command_name = data["data"]["name"]
+        interaction_data: dict = data["data"]
+        command_name = interaction_data["name"]
         cmd = self.bot.commands.get(command_name, None)
 
         if not cmd:
             _log.warning(
-                f"Unhandeled command: {command_name} "
-                "(not found in local command list)"
+                "Unhandeled command: %s "
+                "(not found in local command list)",
+                command_name
             )
             return QuartResponse(
                 "command not found",
                 status=404
             )
 
-        cmd, _ = self._dig_subcommand(cmd, data)
+        cmd, _ = self._dig_subcommand(cmd, interaction_data)
 
         # Now that the command is found, let context know about it
         ctx.command = cmd
@@ -195,17 +265,18 @@ class DiscordHTTP(Quart):
             if isinstance(payload, EmptyResponse):
                 return QuartResponse("", status=202)
 
-            return QuartResponse(
-                payload.to_multipart(),
-                content_type=payload.content_type
-            )
+            return self._make_response(payload)
 
+        except QuartHTTPException:
+            # abort() from within the handler, let Quart send it as-is
+            raise
         except Exception as e:
             if self.bot.has_any_dispatch("interaction_error"):
                 self.bot.dispatch("interaction_error", ctx, e)
             else:
                 _log.error(
-                    f"Error while running command {cmd.name}",
+                    "Error while running command %s",
+                    getattr(cmd, "name", None),
                     exc_info=e
                 )
 
@@ -225,41 +296,29 @@ class DiscordHTTP(Quart):
         _custom_id = data["data"]["custom_id"]
 
         try:
-            local_view = None
-
-            if (
-                local_view is None and
-                ctx.custom_id
-            ):
-                local_view = self.bot._view_storage.get(
-                    ctx.custom_id, None
-                )
-
-            if (
-                local_view is None and
-                ctx.message
-            ):
-                local_view = self.bot._view_storage.get(
-                    ctx.message.id, None
-                )
-
-                if not local_view and ctx.message.interaction:
-                    local_view = self.bot._view_storage.get(
-                        ctx.message.interaction.id, None
+            # custom_id first, then the message and the interaction it came from
+            _view_storage = self.bot._view_storage
+            local_view = (
+                (ctx.custom_id and _view_storage.get(ctx.custom_id, None)) or
+                (ctx.message and (
+                    _view_storage.get(ctx.message.id, None) or
+                    (
+                        ctx.message.interaction and
+                        _view_storage.get(ctx.message.interaction.id, None)
                     )
+                ))
+            )
 
             if local_view:
                 payload = await local_view.callback(ctx)
-                return QuartResponse(
-                    payload.to_multipart(),
-                    content_type=payload.content_type
-                )
+                return self._make_response(payload)
 
             intreact = self.bot.find_interaction(_custom_id)
             if not intreact:
                 _log.debug(
                     "Unhandled interaction recieved "
-                    f"(custom_id: {_custom_id})"
+                    "(custom_id: %s)",
+                    _custom_id
                 )
                 return QuartResponse(
                     "interaction not found",
@@ -267,17 +326,18 @@ class DiscordHTTP(Quart):
                 )
 
             payload = await intreact.run(ctx)
-            return QuartResponse(
-                payload.to_multipart(),
-                content_type=payload.content_type
-            )
+            return self._make_response(payload)
 
+        except QuartHTTPException:
+            # abort() from within the handler, let Quart send it as-is
+            raise
         except Exception as e:
             if self.bot.has_any_dispatch("interaction_error"):
                 self.bot.dispatch("interaction_error", ctx, e)
             else:
                 _log.error(
-                    f"Error while running interaction {_custom_id}",
+                    "Error while running interaction %s",
+                    _custom_id,
                     exc_info=e
                 )
 
@@ -291,28 +351,31 @@ class DiscordHTTP(Quart):
         """ Used to handle autocomplete interactions """
         _log.debug("Received autocomplete interaction, processing...")
 
-        command_name = data.get("data", {}).get("name", None)
-        cmd = self.bot.commands.get(command_name)
+        interaction_data: dict = data.get("data", {})
+        command_name = interaction_data.get("name", None)
+        cmd = self.bot.commands.get(command_name) if command_name else None
 
         try:
             if not cmd:
-                _log.warning(f"Unhandled autocomplete recieved (name: {command_name})")
+                _log.warning("Unhandled autocomplete recieved (name: %s)", command_name)
                 return QuartResponse(
                     "command not found",
                     status=404
                 )
 
-            cmd, data_options = self._dig_subcommand(cmd, data)
+            cmd, data_options = self._dig_subcommand(cmd, interaction_data)
 
-            find_focused = next((
-                x for x in data_options
-                if x.get("focused", False)
-            ), None)
+            find_focused = None
+            for x in data_options:
+                if x.get("focused", False):
+                    find_focused = x
+                    break
 
             if not find_focused:
                 _log.warning(
                     "Failed to find focused option in autocomplete "
-                    f"(cmd name: {command_name})"
+                    "(cmd name: %s)",
+                    command_name
                 )
                 return QuartResponse(
                     "focused option not found",
@@ -322,12 +385,16 @@ class DiscordHTTP(Quart):
             return await cmd.run_autocomplete(
                 ctx, find_focused["name"], find_focused["value"]
             )
+        except QuartHTTPException:
+            # abort() from within the handler, let Quart send it as-is
+            raise
         except Exception as e:
             if self.bot.has_any_dispatch("interaction_error"):
                 self.bot.dispatch("interaction_error", ctx, e)
             else:
                 _log.error(
-                    f"Error while running autocomplete {cmd.name}",
+                    "Error while running autocomplete %s",
+                    getattr(cmd, "name", None),
                     exc_info=e
                 )
             return abort(500)
@@ -339,43 +406,29 @@ class DiscordHTTP(Quart):
         The main function to handle all HTTP requests sent by Discord
         Please do not touch this function, unless you know what you're doing
         """
-        await self._validate_request()
-        data = await request.json
+        raw = await self._validate_request()
 
-        if self.debug_events:
+        try:
+            data = utils.json_loads(raw)
+        except ValueError:
+            return abort(400, "invalid request body")
+
+        if self.debug_events and self.bot.has_any_dispatch("raw_interaction"):
+            # Listeners get their own copy, parsing the body again is cheaper than a deepcopy
             self.bot.dispatch(
                 "raw_interaction",
-                copy.deepcopy(data)
+                utils.json_loads(raw)
             )
 
         context = self.bot._context(self.bot, data)
         data_type = data.get("type", -1)
 
-        match data_type:
-            case InteractionType.ping:
-                return self._handle_ack_ping(context, data)
+        handler = self._interaction_handlers.get(data_type, None)
+        if handler is None:  # Unknown
+            _log.debug("Unhandled interaction recieved (type: %s)", data_type)
+            return abort(400, "invalid request body")
 
-            case InteractionType.application_command:
-                return await self._handle_application_command(
-                    context, data
-                )
-
-            case x if x in (
-                InteractionType.message_component,
-                InteractionType.modal_submit
-            ):
-                return await self._handle_interaction(
-                    context, data
-                )
-
-            case InteractionType.application_command_autocomplete:
-                return await self._handle_autocomplete(
-                    context, data
-                )
-
-            case _:  # Unknown
-                _log.debug(f"Unhandled interaction recieved (type: {data_type})")
-                return abort(400, "invalid request body")
+        return await handler(context, data)
 
     def error_messages(
         self,
@@ -405,28 +458,33 @@ class DiscordHTTP(Quart):
                 ephemeral=True
             )
 
-    async def index_ping(self) -> tuple[dict, int] | dict:
+    async def index_ping(self) -> QuartResponse | tuple[dict, int] | dict:
         """
         Used to ping the interaction url, to check if it's working
         You can overwrite this function to return your own data as well.
-        Remember that it must return `dict`
+        Remember that it must return `dict` or a response from `jsonify`
         """
         if not self.bot.is_ready():
-            return {"error": "bot is not ready yet"}, 503
+            return self.jsonify({"error": "bot is not ready yet"}, status=503)
 
-        return {
-            "@me": {
+        if self._ping_me is None:
+            self._ping_me = {
                 "id": self.bot.user.id,
                 "username": self.bot.user.name,
                 "discriminator": self.bot.user.discriminator,
                 "created_at": str(self.bot.user.created_at.isoformat()),
-            },
+            }
+
+        return self.jsonify({
+            "@me": self._ping_me,
             "last_reboot": {
-                "datetime": str(self.uptime.astimezone().isoformat()),
-                "timedelta": str(utils.utcnow() - self.uptime),
-                "unix": int(self.uptime.timestamp()),
+                "datetime": self._ping_reboot_datetime,
+                "timedelta": str(timedelta(
+                    seconds=time.monotonic() - self._uptime_monotonic
+                )),
+                "unix": self._ping_reboot_unix,
             }
-        }
+        })
 
     def jsonify(
         self,
@@ -455,9 +513,14 @@ class DiscordHTTP(Quart):
         `QuartResponse`
             The response object
         """
+        if sort_keys or indent is not None:
+            body = json.dumps(data, sort_keys=sort_keys, indent=indent)
+        else:
+            body = utils.json_dumps(data)
+
         return QuartResponse(
-            json.dumps(data, sort_keys=sort_keys, indent=indent),
-            headers={"Content-Type": "application/json"},
+            body,
+            mimetype="application/json",
             status=status,
         )
 
@@ -501,19 +564,12 @@ class DiscordHTTP(Quart):
         def _signal_handler(*_: Any) -> None:
             shutdown_event.set()
 
-        for signal_name in {"SIGINT", "SIGTERM", "SIGBREAK"}:
-            if hasattr(signal, signal_name):
-                try:
-                    loop.add_signal_handler(
-                        getattr(signal, signal_name),
-                        _signal_handler
-                    )
-                except NotImplementedError:
-                    # Add signal handler may not be implemented on Windows
-                    signal.signal(
-                        getattr(signal, signal_name),
-                        _signal_handler
-                    )
+        for sig in _SHUTDOWN_SIGNALS:
+            try:
+                loop.add_signal_handler(sig, _signal_handler)
+            except NotImplementedError:
+                # Add signal handler may not be implemented on Windows
+                signal.signal(sig, _signal_handler)
 
         server_name = self.config.get("SERVER_NAME")
         sn_host = None
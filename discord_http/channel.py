@@ -271,11 +271,16 @@ class PartialChannel(PartialBase):
         )
 
         from .message import Message
+
+        # Resolve the guild once, not once per message
+        guild = self.guild
+        state = self._state
+
         return [
             Message(
-                state=self._state,
+                state=state,
                 data=data,
-                guild=self.guild
+                guild=guild
             )
             for data in r.response
         ]
@@ -313,10 +318,10 @@ class PartialChannel(PartialBase):
             f"/channels/{self.id}/threads/archived/public"
         )
 
-        from .channel import PublicThread
+        state = self._state
         return [
             PublicThread(
-                state=self._state,
+                state=state,
                 data=data
             )
             for data in r.response
@@ -346,10 +351,10 @@ class PartialChannel(PartialBase):
 
         r = await self._state.query("GET", path)
 
-        from .channel import PrivateThread
+        state = self._state
         return [
             PrivateThread(
-                state=self._state,
+                state=state,
                 data=data
             )
             for data in r.response
@@ -489,35 +494,7 @@ class PartialChannel(PartialBase):
         state: Optional["DiscordAPI"] = None,
         guild_id: int | None = None
     ) -> "BaseChannel":
-        match data["type"]:
-            case x if x in (ChannelType.guild_text, ChannelType.guild_news):
-                _class = TextChannel
-
-            case ChannelType.guild_voice:
-                _class = VoiceChannel
-
-            case ChannelType.guild_category:
-                _class = CategoryChannel
-
-            case ChannelType.guild_news_thread:
-                _class = NewsThread
-
-            case ChannelType.guild_public_thread:
-                _class = PublicThread
-
-            case ChannelType.guild_private_thread:
-                _class = PrivateThread
-
-            case ChannelType.guild_stage_voice:
-                _class = StageChannel
-
-            case ChannelType.guild_forum:
-                _class = ForumChannel
-
-            case _:
-                _class = BaseChannel
-
-        _class: type["BaseChannel"]
+        _class = _CHANNEL_TYPES.get(data["type"], BaseChannel)
 
         if guild_id is not None:
             data["guild_id"] = int(guild_id)
@@ -2419,3 +2396,17 @@ class StageChannel(VoiceChannel):
             guild=self.guild
         )
         return self._stage_instance
+
+
+# Channel type value -> class used by PartialChannel._class_to_return
+_CHANNEL_TYPES: dict[int, type[BaseChannel]] = {
+    ChannelType.guild_text.value: TextChannel,
+    ChannelType.guild_news.value: TextChannel,
+    ChannelType.guild_voice.value: VoiceChannel,
+    ChannelType.guild_category.value: CategoryChannel,
+    ChannelType.guild_news_thread.value: NewsThread,
+    ChannelType.guild_public_thread.value: PublicThread,
+    ChannelType.guild_private_thread.value: PrivateThread,
+    ChannelType.guild_stage_voice.value: StageChannel,
+    ChannelType.guild_forum.value: ForumChannel,
+}
@@ -94,7 +94,8 @@ class Client:
         api_version: `Optional[int]`
             API version to use for both HTTP and WS, if not provided, it will use the default (10)
         loop: `Optional[asyncio.AbstractEventLoop]`
-            Event loop to use, if not provided, it will use `asyncio.get_running_loop()`
+            Event loop to use, if not provided, it will use `asyncio.get_running_loop()`.
+            If there is no running loop, a new one is made, using uvloop if it is installed
         allowed_mentions: `AllowedMentions`
             Allowed mentions to use, if not provided, it will use `AllowedMentions.all()`
         enable_gateway: `bool`
@@ -147,15 +148,25 @@ class Client:
         try:
             self.loop: asyncio.AbstractEventLoop = loop or asyncio.get_running_loop()
         except RuntimeError:
-            self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+            # Only imported here, a given or running loop never needs uvloop
+            try:
+                import uvloop  # pyright: ignore[reportMissingImports]
+            except ImportError:
+                self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+            else:
+                self.loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
             asyncio.set_event_loop(self.loop)
 
         self.commands: Dict[str, Command] = {}
-        self.listeners: list[Listener] = []
+        # Only changed through add/remove_listener, so the counts stay in sync
+        self._listeners: list[Listener] = []
+        # Listener name -> amount registered, names without listeners are removed
+        self._listener_counts: dict[str, int] = {}
         self.interactions: Dict[str, Interaction] = {}
         self.interactions_regex: Dict[str, Interaction] = {}
 
-        self._global_cmd_checks: list[Callable] = []
+        # (check, is coroutine function), resolved once when the check is added
+        self._global_cmd_checks: list[tuple[Callable, bool]] = []
 
         self._gateway_cache: Optional["GatewayCacheFlags"] = gateway_cache
         self._ready: Optional[asyncio.Event] = asyncio.Event()
@@ -176,8 +187,8 @@ class Client:
         utils.setup_logger(level=self.logging_level)
 
     async def _run_global_checks(self, ctx: Context) -> bool:
-        for g in self._global_cmd_checks:
-            if inspect.iscoroutinefunction(g):
+        for g, is_coro in self._global_cmd_checks:
+            if is_coro:
                 result = await g(ctx)
             else:
                 result = g(ctx)
@@ -456,6 +467,14 @@ class Client:
         """
         return self.cache.guilds
 
+    @property
+    def listeners(self) -> tuple[Listener, ...]:
+        """
+        `tuple[Listener, ...]`: Returns all the listeners of the bot.
+        This is read-only, use `add_listener()` and `remove_listener()` to change them
+        """
+        return tuple(self._listeners)
+
     def get_guild(self, guild_id: int) -> Guild | PartialGuild | None:
         """
         Get a guild object from the cache.
@@ -627,7 +646,7 @@ class Client:
         **kwargs: `Any`
             The keyword arguments to pass to the event.
         """
-        for listener in self.listeners:
+        for listener in self._listeners:
             if listener.name != f"on_{event_name}":
                 continue
 
@@ -654,12 +673,7 @@ class Client:
         `bool`
             Whether the bot has any listeners for the event.
         """
-        event = next((
-            x for x in self.listeners
-            if x.name == f"on_{event_name}"
-        ), None)
-
-        return event is not None
+        return self._listener_counts.get(f"on_{event_name}", 0) > 0
 
     async def load_extension(
         self,
@@ -2010,7 +2024,8 @@ class Client:
         func: `Listener`
             The listener to add to the bot.
         """
-        self.listeners.append(func)
+        self._listeners.append(func)
+        self._listener_counts[func.name] = self._listener_counts.get(func.name, 0) + 1
         return func
 
     def remove_listener(
@@ -2025,7 +2040,10 @@ class Client:
         func: `Listener`
             The listener to remove from the bot.
         """
-        self.listeners.remove(func)
+        self._listeners.remove(func)
+        self._listener_counts[func.name] -= 1
+        if not self._listener_counts[func.name]:
+            del self._listener_counts[func.name]
 
     def add_command(
         self,
@@ -2068,7 +2086,9 @@ class Client:
         func: `Callable`
             The function to add
         """
-        self._global_cmd_checks.append(func)
+        self._global_cmd_checks.append(
+            (func, inspect.iscoroutinefunction(func))
+        )
 
         return func
 
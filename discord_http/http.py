@@ -7,11 +7,12 @@ import sys
 
 from aiohttp.client_exceptions import ContentTypeError
 from collections import deque
+from contextlib import AbstractAsyncContextManager
 from multidict import CIMultiDictProxy
 from typing import Any, Self, overload, Literal, TypeVar, Generic, TYPE_CHECKING
 from urllib.parse import quote as url_quote
 
-from . import __version__
+from . import __version__, utils
 from .flags import ApplicationFlags
 from .errors import (
     NotFound, DiscordServerError,
@@ -80,9 +81,16 @@ class HTTPClient:
             await self.session.close()
 
         self.session = HTTPSession(
-            connector=aiohttp.TCPConnector(limit=0),
+            connector=aiohttp.TCPConnector(
+                limit=0,
+                # Keep idle sockets (API and CDN) around between bursts
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            ),
             timeout=aiohttp.ClientTimeout(total=60),
-            cookie_jar=aiohttp.DummyCookieJar()
+            cookie_jar=aiohttp.DummyCookieJar(),
+            # Uses orjson for json= payloads if it is installed
+            json_serialize=utils.json_dumps
         )
 
     async def _close_session(self) -> None:
@@ -187,6 +195,33 @@ class HTTPClient:
 
         return output
 
+    def stream(
+        self,
+        method: MethodTypes,
+        url: str,
+        **kwargs
+    ) -> AbstractAsyncContextManager[aiohttp.ClientResponse]:
+        """
+        Make a request using the aiohttp library, without reading the body.
+        Useful for large downloads that should be read in chunks
+
+        Parameters
+        ----------
+        method: `str`
+            The HTTP method to use
+        url: `str`
+            The URL to make the request to
+
+        Returns
+        -------
+        `AbstractAsyncContextManager[aiohttp.ClientResponse]`
+            The response, to be used with `async with`
+        """
+        if method.upper() not in MethodTypes.__args__:
+            raise ValueError(f"Invalid HTTP method: {method}")
+
+        return self.session.request(method.upper(), str(url), **kwargs)
+
 
 class Ratelimit:
     def __init__(self, key: str):
@@ -588,7 +588,7 @@ class Attachment:
             res_method="read"
         )
 
-        if r.status not in range(200, 300):
+        if not 200 <= r.status < 300:
             raise HTTPException(r)
 
         return r.response
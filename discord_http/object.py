@@ -12,6 +12,8 @@ class Snowflake:
     """
     A class to represent a Discord Snowflake
     """
+    __slots__ = ("id",)
+
     def __init__(
         self,
         id: int | str
@@ -107,6 +109,8 @@ class PartialBase(Snowflake):
     This class is based on the Snowflae class standard,
     but with a few extra attributes.
     """
+    __slots__ = ()
+
     def __init__(self, *, id: int):
         super().__init__(id=int(id))
 
@@ -1,3 +1,4 @@
+import json
 import logging
 import re
 import sys
@@ -13,6 +14,11 @@ from .file import File
 if TYPE_CHECKING:
     from .object import Snowflake
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DISCORD_EPOCH = 1420070400000
 
 # RegEx patterns
@@ -486,6 +492,49 @@ def get_int(
     return int(output)
 
 
+def json_dumps(data: Any) -> str:
+    """
+    Serialize an object to JSON, using orjson if it is installed
+
+    Parameters
+    ----------
+    data: `Any`
+        The object to serialize
+
+    Returns
+    -------
+    `str`
+        The JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Parse JSON, using orjson if it is installed
+
+    Parameters
+    ----------
+    data: `str | bytes`
+        The JSON to parse
+
+    Returns
+    -------
+    `Any`
+        The parsed object
+
+    Raises
+    ------
+    `ValueError`
+        The data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class _MissingType:
     """
     A class to represent a missing value in a dictionary
@@ -0,0 +1,51 @@
+"""
+Checks that the lazy export table in discord_http/__init__.py
+stays in sync with the __all__ of every submodule it points to.
+
+Run with: python -m pytest tests/test_lazy_exports.py
+"""
+
+import ast
+import importlib
+
+from pathlib import Path
+
+import discord_http
+
+
+def test_lazy_modules_match_submodule_all():
+    for module, names in discord_http._lazy_modules.items():
+        submodule = importlib.import_module(f"discord_http.{module}")
+        assert set(names) == set(submodule.__all__), (
+            f"_lazy_modules[{module!r}] does not match discord_http.{module}.__all__"
+        )
+
+
+def test_lazy_modules_cover_type_checking_imports():
+    # Every `from .module import *` for type checkers should be lazily exported too
+    tree = ast.parse(Path(discord_http.__file__).read_text())
+    star_imports = {
+        node.module
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom)
+        and node.level == 1
+        and any(alias.name == "*" for alias in node.names)
+    }
+
+    assert star_imports == set(discord_http._lazy_modules)
+
+
+def test_lazy_names_resolve():
+    for name in discord_http.__all__:
+        assert getattr(discord_http, name) is not None
+
+
+def test_star_import_keeps_submodules():
+    namespace = {}
+    exec("from discord_http import *", namespace)
+
+    for name in ("commands", "utils", "enums", "gateway"):
+        assert name in namespace
+
+    for name in ("importlib", "Any", "TYPE_CHECKING"):
+        assert not hasattr(discord_http, name)